@@ -1,8 +1,6 @@
 import os
 import datetime
 import asyncio
-from google.adk.agents import LlmAgent
-from google.adk.tools import FunctionTool
 
 
 def get_current_time() -> str:
@@ -50,6 +48,10 @@ def main():
     # Set OpenAI API key in environment variable
     os.environ["OPENAI_API_KEY"] = openai_api_key
     
+    # Imported here so importing this module doesn't load google.adk
+    from google.adk.agents import LlmAgent
+    from google.adk.tools import FunctionTool
+    
     # Define the greeter agent
     greeter = LlmAgent(
         name="greeter",
@@ -86,10 +88,13 @@ def main():
     print("- 'Can you tell me the current time?'")
     print("- 'Please organize my files'")
     
-    loop = asyncio.get_event_loop()
-    
+    # Run the whole conversation on a single event loop
+    asyncio.run(main_async(coordinator))
+
+
+async def main_async(coordinator):
     while True:
-        # Get user input
+        # Get user input; nothing else runs on the loop while we wait
         user_input = input("\nYou: ")
         
         if user_input.lower() in ['exit', 'quit']:
@@ -98,7 +103,7 @@ def main():
         
         try:
             # Process the async response
-            response = loop.run_until_complete(process_agent_response(coordinator, user_input))
+            response = await process_agent_response(coordinator, user_input)
             
             # Print the agent's response
             # Handle different response types
@@ -0,0 +1,180 @@
+import asyncio
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+import app
+
+
+@pytest.mark.parametrize("query", [
+    "What time is it?",
+    "what time is it now",
+    "what's the time",
+    "what is the current time?",
+    "tell me the time right now",
+])
+def test_direct_time_answers_current_time_questions(query):
+    query_lower = query.lower()
+    response = app.task_executor._direct_time(query_lower, app.tokenize(query_lower))
+    assert response is not None
+    assert response.startswith("The current time is ")
+
+
+@pytest.mark.parametrize("query", [
+    "how much time does a marathon take?",
+    "what's the current time in Tokyo?",
+    "what time is it in London",
+    "I have no time right now, just summarize",
+    "what time does the store open?",
+    "fix my clock",
+])
+def test_direct_time_leaves_other_questions_to_the_llm(query):
+    query_lower = query.lower()
+    assert app.task_executor._direct_time(query_lower, app.tokenize(query_lower)) is None
+
+
+@pytest.fixture
+def mock_openai(monkeypatch):
+    """Point the app at an OpenAI client backed by httpx.MockTransport and count upstream calls."""
+    calls = {"/v1/chat/completions": 0, "/v1/embeddings": 0}
+
+    async def handler(request):
+        calls[request.url.path] += 1
+        # Keep the first call in flight while the others arrive
+        await asyncio.sleep(0.05)
+        if request.url.path == "/v1/embeddings":
+            return httpx.Response(200, json={
+                "object": "list",
+                "data": [{"object": "embedding", "index": 0, "embedding": [1.0, 0.0]}],
+                "model": app.OPENAI_EMBEDDING_MODEL,
+                "usage": {"prompt_tokens": 1, "total_tokens": 1}
+            })
+        return httpx.Response(200, json={
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": app.OPENAI_MODEL,
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": "Hi there!"}
+            }]
+        })
+
+    client = AsyncOpenAI(
+        api_key="sk-test",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        max_retries=0
+    )
+    monkeypatch.setattr(app, "USE_OPENAI", True)
+    monkeypatch.setattr(app, "openai_client", client)
+    monkeypatch.setattr(app, "embedding_client", client)
+    monkeypatch.setattr(app, "response_cache", app.ResponseCache())
+    monkeypatch.setattr(app, "semantic_cache", app.SemanticCache())
+    monkeypatch.setattr(app, "request_coalescer", app.RequestCoalescer())
+    return calls
+
+
+def test_concurrent_identical_asks_make_one_upstream_call(mock_openai):
+    async def ask_five_times():
+        client = app.app.test_client()
+        body = {"agent": "greeter", "query": "Tell me a joke"}
+        responses = await asyncio.gather(*(client.post("/ask", json=body) for _ in range(5)))
+        return [await response.get_json() for response in responses]
+
+    results = asyncio.run(ask_five_times())
+
+    assert [result["response"] for result in results] == ["Hi there!"] * 5
+    assert mock_openai == {"/v1/chat/completions": 1, "/v1/embeddings": 1}
+
+
+def test_coalescer_works_across_event_loops(mock_openai):
+    # A second asyncio.run must not wait on state left from the first loop
+    first = asyncio.run(app.greeter.respond("Tell me a joke"))
+    app.response_cache = app.ResponseCache()
+    app.semantic_cache = app.SemanticCache()
+    second = asyncio.run(asyncio.wait_for(app.greeter.respond("Tell me a joke"), 2))
+
+    assert first == second == ("Hi there!", "openai")
+    assert mock_openai["/v1/chat/completions"] == 2
+
+
+def test_semantic_cache_save_load_merges_workers(tmp_path):
+    path = str(tmp_path / "semcache")
+    normalize = app.SemanticCache.normalize
+
+    first = app.SemanticCache(threshold=0.999)
+    first.add("greeter", normalize([1.0, 0.0]), "a")
+    first.save(path)
+
+    # A second worker with a different query that happens to share the answer
+    second = app.SemanticCache(threshold=0.999)
+    second.add("greeter", normalize([1.0, 0.1]), "a")
+    second.add("task_executor", normalize([0.0, 1.0]), "b")
+    second.save(path)
+    first.save(path)
+
+    loaded = app.SemanticCache(threshold=0.999)
+    loaded.load(path)
+
+    assert loaded.lookup("greeter", normalize([1.0, 0.0])) == "a"
+    assert loaded.lookup("greeter", normalize([1.0, 0.1])) == "a"
+    assert loaded.lookup("task_executor", normalize([0.0, 1.0])) == "b"
+    assert loaded.lookup("greeter", normalize([0.0, 1.0])) is None
+
+
+def test_semantic_cache_evicts_oldest_entry_when_full(tmp_path):
+    normalize = app.SemanticCache.normalize
+    cache = app.SemanticCache(threshold=0.999, maxsize=2)
+    cache.add("greeter", normalize([1.0, 0.0, 0.0]), "a")
+    cache.add("greeter", normalize([0.0, 1.0, 0.0]), "b")
+    cache.add("greeter", normalize([0.0, 0.0, 1.0]), "c")
+
+    assert cache.lookup("greeter", normalize([1.0, 0.0, 0.0])) is None
+    assert cache.lookup("greeter", normalize([0.0, 1.0, 0.0])) == "b"
+    assert cache.lookup("greeter", normalize([0.0, 0.0, 1.0])) == "c"
+
+    # The wrapped ring is saved oldest first and reloads the same entries
+    path = str(tmp_path / "semcache")
+    cache.save(path)
+    loaded = app.SemanticCache(threshold=0.999, maxsize=2)
+    loaded.load(path)
+    loaded.add("greeter", normalize([1.0, 0.0, 0.0]), "d")
+
+    assert loaded.lookup("greeter", normalize([0.0, 1.0, 0.0])) is None
+    assert loaded.lookup("greeter", normalize([0.0, 0.0, 1.0])) == "c"
+    assert loaded.lookup("greeter", normalize([1.0, 0.0, 0.0])) == "d"
+
+
+@pytest.mark.parametrize("content", [b"", b"not a cache file", b"PK\x03\x04truncated"])
+def test_semantic_cache_unreadable_file_raises_file_error(tmp_path, content):
+    path = tmp_path / "semcache"
+    path.write_bytes(content)
+
+    with pytest.raises(app.SemanticCache.FILE_ERRORS):
+        app.SemanticCache().load(str(path))
+
+
+def test_semantic_cache_save_replaces_unreadable_file(tmp_path):
+    path = tmp_path / "semcache"
+    path.write_bytes(b"not a cache file")
+    normalize = app.SemanticCache.normalize
+
+    cache = app.SemanticCache(threshold=0.999)
+    cache.add("greeter", normalize([1.0, 0.0]), "a")
+    cache.save(str(path))
+
+    loaded = app.SemanticCache(threshold=0.999)
+    loaded.load(str(path))
+    assert loaded.lookup("greeter", normalize([1.0, 0.0])) == "a"
+
+
+def test_http_client_closed_after_serving(monkeypatch):
+    async def serve_and_stop(client):
+        monkeypatch.setattr(app, "http_client", client)
+        async with app.app.test_app():
+            assert not client.is_closed
+        return client.is_closed
+
+    assert asyncio.run(serve_and_stop(httpx.AsyncClient()))